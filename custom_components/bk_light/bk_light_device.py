@@ -2,14 +2,18 @@
 from __future__ import annotations
 
 import asyncio
-import binascii
 import logging
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from typing import Optional
+from typing import Any, Callable, Optional
 
 from bleak import BleakClient, BleakScanner
+from bleak.backends.device import BLEDevice
 from bleak.exc import BleakError
-from PIL import Image, ImageEnhance
+import numpy as np
+from PIL import Image
 
 from .const import (
     ACK_STAGE_ONE,
@@ -17,14 +21,35 @@ from .const import (
     ACK_STAGE_TWO,
     ACK_STAGE_TWO_ALT,
     ACK_STAGE_THREE,
+    ATT_HEADER_SIZE,
+    DEFAULT_MTU_SIZE,
+    DEVICE_NAME_PREFIXES,
     HANDSHAKE_FIRST,
     HANDSHAKE_SECOND,
+    KEEPALIVE_INTERVAL,
+    KEEPALIVE_MAX_BACKOFF,
+    MIN_WRITE_SIZE,
     UUID_NOTIFY,
     UUID_WRITE,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Frame header: total length, type, length, CRC32 of the PNG payload
+_FRAME_HEADER = struct.Struct("<HB2sH2sI2s")
+
+# Brightness at or above this is treated as unity and not scaled
+_FULL_BRIGHTNESS = 0.995
+
+# ACK notifications are matched on their first 5 bytes
+_ACK_PREFIX_TO_STAGE = {
+    ACK_STAGE_ONE[:5]: 1,
+    ACK_STAGE_ONE_ALT[:5]: 1,
+    ACK_STAGE_TWO[:5]: 2,
+    ACK_STAGE_TWO_ALT[:5]: 2,
+    ACK_STAGE_THREE[:5]: 3,
+}
+
 
 class BKLightDevice:
     """Representation of a BK Light ACT1026 BLE device."""
@@ -40,92 +65,63 @@ class BKLightDevice:
         self.rotation = rotation
         self._brightness = brightness
         self.client: Optional[BleakClient] = None
-        self._ack_stage = 0
-        self._ack_event = asyncio.Event()
+        self._ack_queue: asyncio.Queue[int] = asyncio.Queue()
         self._is_connected = False
+        self._frame_cache_key: Optional[bytes] = None
+        self._frame_cache_val: Optional[bytes] = None
+        self._png_cache_key: Optional[tuple] = None
+        self._png_cache_val: Optional[bytes] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._keepalive_task: Optional[asyncio.Task] = None
+        self._connect_lock = asyncio.Lock()
 
     def _notification_handler(self, _sender: int, data: bytearray) -> None:
         """Handle BLE notifications."""
-        payload = bytes(data)
-        _LOGGER.debug("Received notification: %s", payload.hex())
-
-        # Check ACK patterns
-        if len(payload) >= 5:
-            prefix = payload[:5]
-            if prefix == ACK_STAGE_ONE[:5] or prefix == ACK_STAGE_ONE_ALT[:5]:
-                self._ack_stage = 1
-                _LOGGER.debug("ACK Stage 1 received")
-            elif prefix == ACK_STAGE_TWO[:5] or prefix == ACK_STAGE_TWO_ALT[:5]:
-                self._ack_stage = 2
-                _LOGGER.debug("ACK Stage 2 received")
-            elif prefix == ACK_STAGE_THREE[:5]:
-                self._ack_stage = 3
-                _LOGGER.debug("ACK Stage 3 received")
-            self._ack_event.set()
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Received notification: %s", data.hex())
+
+        view = memoryview(data)
+        if len(view) < 5:
+            return
+
+        stage = _ACK_PREFIX_TO_STAGE.get(view[:5].tobytes())
+        if stage:
+            _LOGGER.debug("ACK Stage %d received", stage)
+            self._ack_queue.put_nowait(stage)
 
     async def connect(self) -> bool:
         """Connect to the BLE device."""
+        # Keepalive, sends and entity updates may all reconnect at once,
+        # the display only accepts a single connection
+        async with self._connect_lock:
+            return await self._connect()
+
+    async def _connect(self) -> bool:
+        """Connect to the BLE device, caller holds the connect lock."""
         try:
             if self.client and self.client.is_connected:
                 return True
 
             _LOGGER.info("Attempting to connect to device at %s...", self.address)
-            
-            # First, do a general scan to see what's available
-            _LOGGER.debug("Starting BLE scan (15 seconds)...")
+
+            # Direct lookups first, a full discovery scan only as last resort
             try:
-                devices = await BleakScanner.discover(timeout=15.0)
-                _LOGGER.debug("Found %d BLE devices total", len(devices))
-                
-                # Log devices that might be BK Light displays
-                for d in devices:
-                    if d.name and any(prefix in d.name for prefix in ["LED_BLE", "BK_LIGHT", "BJ_LED"]):
-                        _LOGGER.info(
-                            "Found potential BK Light: %s at %s (RSSI: %s dBm)",
-                            d.name,
-                            d.address,
-                            getattr(d, 'rssi', 'N/A')
-                        )
-                
-                # Try to find our specific device
-                device = next((d for d in devices if d.address.upper() == self.address.upper()), None)
-                
-                if device:
-                    _LOGGER.info(
-                        "Target device found: %s at %s (RSSI: %s dBm)",
-                        getattr(device, 'name', 'Unknown'),
-                        device.address,
-                        getattr(device, 'rssi', 'N/A')
-                    )
-                else:
+                device = await BleakScanner.find_device_by_address(
+                    self.address, timeout=5.0
+                )
+                if device is None:
                     _LOGGER.warning(
-                        "Device %s not found in scan. Found %d devices total. "
-                        "Attempting direct connection...",
+                        "Device %s not found by address. Running a full discovery scan...",
                         self.address,
-                        len(devices)
                     )
-                    # Try find_device_by_address as fallback
-                    try:
-                        device = await BleakScanner.find_device_by_address(
-                            self.address, timeout=10.0, cached=False
-                        )
-                    except TypeError:
-                        device = await BleakScanner.find_device_by_address(
-                            self.address, timeout=10.0
-                        )
-            
+                    device = await self._discover_device()
             except Exception as scan_err:
-                _LOGGER.warning("Error during discovery scan: %s. Trying direct connection...", scan_err)
+                _LOGGER.warning("Error while looking up device: %s. Trying direct connection...", scan_err)
                 # Fallback to direct address lookup
-                try:
-                    device = await BleakScanner.find_device_by_address(
-                        self.address, timeout=15.0, cached=False
-                    )
-                except TypeError:
-                    device = await BleakScanner.find_device_by_address(
-                        self.address, timeout=15.0
-                    )
-            
+                device = await BleakScanner.find_device_by_address(
+                    self.address, timeout=15.0
+                )
+
             if device is None:
                 _LOGGER.error(
                     "Device %s not found after extensive scanning. "
@@ -153,6 +149,9 @@ class BKLightDevice:
             
             self._is_connected = True
             _LOGGER.info("Successfully connected to BK Light at %s", self.address)
+
+            if self._keepalive_task is None or self._keepalive_task.done():
+                self._keepalive_task = asyncio.create_task(self._keepalive_loop())
             return True
             
         except BleakError as err:
@@ -181,91 +180,231 @@ class BKLightDevice:
                 self.client = None
             return False
 
+    async def _discover_device(self) -> Optional[BLEDevice]:
+        """Run a full discovery scan and return the device if seen."""
+        _LOGGER.debug("Starting BLE scan (15 seconds)...")
+        devices = await BleakScanner.discover(timeout=15.0)
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Found %d BLE devices total", len(devices))
+            # Log devices that might be BK Light displays
+            for d in devices:
+                if d.name and d.name.startswith(DEVICE_NAME_PREFIXES):
+                    _LOGGER.debug(
+                        "Found potential BK Light: %s at %s (RSSI: %s dBm)",
+                        d.name,
+                        d.address,
+                        getattr(d, 'rssi', 'N/A')
+                    )
+
+        address = self.address.upper()
+        device = next((d for d in devices if d.address.upper() == address), None)
+        if device:
+            _LOGGER.info(
+                "Target device found: %s at %s (RSSI: %s dBm)",
+                getattr(device, 'name', 'Unknown'),
+                device.address,
+                getattr(device, 'rssi', 'N/A')
+            )
+        return device
+
+    async def _keepalive_loop(self) -> None:
+        """Reconnect in the background so sends do not pay the connect cost."""
+        delay = KEEPALIVE_INTERVAL
+        while True:
+            await asyncio.sleep(delay)
+            if self.client and self.client.is_connected:
+                delay = KEEPALIVE_INTERVAL
+                continue
+
+            self._is_connected = False
+            _LOGGER.debug("Connection to %s lost, reconnecting...", self.address)
+            if await self.connect():
+                delay = KEEPALIVE_INTERVAL
+            else:
+                delay = min(delay * 2, KEEPALIVE_MAX_BACKOFF)
+                _LOGGER.debug("Reconnect failed, retrying in %d seconds", delay)
+
     async def disconnect(self):
         """Disconnect from the device."""
-        if self.client:
-            try:
-                if self.client.is_connected:
-                    await self.client.stop_notify(UUID_NOTIFY)
-                    await self.client.disconnect()
-            except Exception as err:
-                _LOGGER.error("Error disconnecting: %s", err)
-            finally:
-                self.client = None
-                self._is_connected = False
+        # Wait for an in-flight connect so it cannot revive the link or the
+        # keepalive loop after we return
+        async with self._connect_lock:
+            if self._keepalive_task:
+                self._keepalive_task.cancel()
+                self._keepalive_task = None
+
+            if self.client:
+                try:
+                    if self.client.is_connected:
+                        await self.client.stop_notify(UUID_NOTIFY)
+                        await self.client.disconnect()
+                except Exception as err:
+                    _LOGGER.error("Error disconnecting: %s", err)
+                finally:
+                    self.client = None
+                    self._is_connected = False
+
+            if self._executor:
+                self._executor.shutdown(wait=False)
+                self._executor = None
 
     async def _wait_for_ack(self, expected_stage: int, timeout: float = 5.0) -> bool:
-        """Wait for ACK stage."""
+        """Wait for ACK stage, skipping ACKs queued for other stages."""
         try:
-            await asyncio.wait_for(self._ack_event.wait(), timeout=timeout)
-            self._ack_event.clear()
-            return self._ack_stage == expected_stage
-        except asyncio.TimeoutError:
+            async with asyncio.timeout(timeout):
+                while True:
+                    stage = await self._ack_queue.get()
+                    if stage == expected_stage:
+                        return True
+                    _LOGGER.debug(
+                        "Ignoring ACK stage %d while waiting for %d", stage, expected_stage
+                    )
+        except TimeoutError:
             _LOGGER.warning("ACK timeout for stage %d", expected_stage)
             return False
 
+    def _drain_acks(self) -> None:
+        """Drop ACKs left over from a previous send."""
+        while not self._ack_queue.empty():
+            self._ack_queue.get_nowait()
+
+    def _payload_crc(self, png_bytes: bytes) -> int:
+        """Return the CRC32 of the payload."""
+        return zlib.crc32(memoryview(png_bytes))
+
+    def _build_header(self, data_length: int, crc: int) -> bytes:
+        """Build frame header."""
+        return _FRAME_HEADER.pack(
+            data_length + _FRAME_HEADER.size,
+            0x02,
+            b"\x00\x00",
+            data_length,
+            b"\x00\x00",
+            crc,
+            b"\x00\x65",
+        )
+
     def _build_frame(self, png_bytes: bytes) -> bytes:
-        """Build frame payload."""
-        data_length = len(png_bytes)
-        total_length = data_length + 15
-        frame = bytearray()
-        frame += total_length.to_bytes(2, "little")
-        frame.append(0x02)
-        frame += b"\\x00\\x00"
-        frame += data_length.to_bytes(2, "little")
-        frame += b"\\x00\\x00"
-        frame += binascii.crc32(png_bytes).to_bytes(4, "little")
-        frame += b"\\x00\\x65"
-        frame += png_bytes
-        return bytes(frame)
+        """Build frame payload, reusing the last frame for an unchanged PNG."""
+        if png_bytes == self._frame_cache_key:
+            return self._frame_cache_val
+
+        header = self._build_header(len(png_bytes), self._payload_crc(png_bytes))
+        frame = header + png_bytes
+        self._frame_cache_key = png_bytes
+        self._frame_cache_val = frame
+        return frame
+
+    async def _write_frame(self, frame: bytes) -> None:
+        """Write a frame to the device split into MTU sized chunks."""
+        # The characteristic reports the negotiated size, client.mtu_size is
+        # only the 23 byte default on BlueZ unless the MTU was acquired
+        char = self.client.services.get_characteristic(UUID_WRITE)
+        if char is not None:
+            chunk_size = char.max_write_without_response_size
+        else:
+            chunk_size = DEFAULT_MTU_SIZE - ATT_HEADER_SIZE
+        chunk_size = max(MIN_WRITE_SIZE, chunk_size)
+        view = memoryview(frame)
+        total = len(frame)
+
+        for offset in range(0, total, chunk_size):
+            last = offset + chunk_size >= total
+            await self.client.write_gatt_char(
+                UUID_WRITE, bytes(view[offset:offset + chunk_size]), response=last
+            )
 
     def _adjust_image(self, image: Image.Image) -> bytes:
         """Adjust image brightness and rotation, return PNG bytes."""
-        if self.rotation != 0:
-            image = image.rotate(-self.rotation, expand=True)
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        return self._adjust_array(np.asarray(image))
 
-        if self._brightness < 1.0:
-            enhancer = ImageEnhance.Brightness(image)
-            image = enhancer.enhance(self._brightness)
+    def _adjust_array(self, arr: np.ndarray) -> bytes:
+        """Adjust RGB pixel array brightness and rotation, return PNG bytes."""
+        # Static displays resend the same frame, skip the pipeline then
+        key = (arr.shape, arr.tobytes(), self.rotation, self._brightness)
+        if key == self._png_cache_key:
+            return self._png_cache_val
+
+        # Rotate and scale in one ndarray pass, PIL only encodes the result
+        if self.rotation % 90:
+            # Arbitrary angles still need PIL's affine transform
+            arr = np.asarray(
+                Image.fromarray(arr, "RGB").rotate(-self.rotation, expand=True)
+            )
+        elif self.rotation % 360:
+            # PIL rotates clockwise here, np.rot90 counter-clockwise
+            arr = np.rot90(arr, k=-(self.rotation // 90) % 4)
+        if self._brightness < _FULL_BRIGHTNESS:
+            # Fixed-point scale, factor <= 256 so no clipping is needed
+            factor = int(self._brightness * 256)
+            arr = (arr.astype(np.uint16) * factor) >> 8
 
         buffer = BytesIO()
-        image.save(buffer, format="PNG", optimize=False)
-        return buffer.getvalue()
+        Image.fromarray(np.ascontiguousarray(arr, dtype=np.uint8), "RGB").save(
+            buffer, format="PNG", optimize=False, compress_level=1
+        )
+        png_bytes = buffer.getvalue()
+
+        self._png_cache_key = key
+        self._png_cache_val = png_bytes
+        return png_bytes
+
+    async def send_image(self, image: Image.Image, delay: float = 0.0) -> bool:
+        """Send an image to the display.
 
-    async def send_image(self, image: Image.Image, delay: float = 0.2) -> bool:
-        """Send an image to the display."""
+        Handshake stages are paced by the device ACKs, delay adds an optional
+        pause after each of them.
+        """
+        return await self._send(self._adjust_image, image, delay)
+
+    async def send_image_array(self, arr: np.ndarray, delay: float = 0.0) -> bool:
+        """Send an RGB uint8 pixel array of shape (height, width, 3) to the display."""
+        return await self._send(self._adjust_array, arr, delay)
+
+    async def _send(
+        self,
+        adjust: Callable[[Any], bytes],
+        pixels: Image.Image | np.ndarray,
+        delay: float,
+    ) -> bool:
+        """Encode pixels with adjust and send the frame to the display."""
         if not self.client or not self.client.is_connected:
             if not await self.connect():
                 return False
 
         try:
             # Adjust image
+            if self._executor is None:
+                # Own worker so PIL work does not queue behind the shared pool
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="bk_light_png"
+                )
             png_bytes = await asyncio.get_event_loop().run_in_executor(
-                None, self._adjust_image, image
+                self._executor, adjust, pixels
             )
             frame = self._build_frame(png_bytes)
 
             # Handshake stage 1
-            self._ack_stage = 0
-            self._ack_event.clear()
+            self._drain_acks()
             await self.client.write_gatt_char(UUID_WRITE, HANDSHAKE_FIRST, response=False)
             if not await self._wait_for_ack(1):
                 raise BleakError("Handshake stage 1 failed")
-            await asyncio.sleep(delay)
+            if delay:
+                await asyncio.sleep(delay)
 
             # Handshake stage 2
-            self._ack_event.clear()
             await self.client.write_gatt_char(UUID_WRITE, HANDSHAKE_SECOND, response=False)
             # Stage 2 ACK may not always arrive, continue anyway
-            try:
-                await self._wait_for_ack(2, timeout=2.0)
-            except asyncio.TimeoutError:
+            if not await self._wait_for_ack(2, timeout=2.0):
                 _LOGGER.debug("Stage 2 ACK skipped")
-            await asyncio.sleep(delay)
+            if delay:
+                await asyncio.sleep(delay)
 
-            # Send frame
-            self._ack_event.clear()
-            await self.client.write_gatt_char(UUID_WRITE, frame, response=True)
+            # Send frame in MTU sized writes, only the last one with response
+            await self._write_frame(frame)
             if not await self._wait_for_ack(3):
                 raise BleakError("Frame send failed")
 
@@ -1,10 +1,11 @@
 """Config flow for BK Light ACT1026 integration."""
 from __future__ import annotations
 
-import asyncio
 import logging
+import re
 from typing import Any
 
+from bleak import BleakScanner
 import voluptuous as vol
 
 from homeassistant import config_entries
@@ -22,24 +23,16 @@ from .const import (
     DEFAULT_ROTATION,
     DOMAIN,
 )
-from .bk_light_device import BKLightDevice
 
 _LOGGER = logging.getLogger(__name__)
 
 # Bluetooth MAC address validation
+_MAC_RE = re.compile(r"[0-9A-Fa-f]{2}(?::[0-9A-Fa-f]{2}){5}")
+
+
 def is_valid_mac_address(address: str) -> bool:
     """Validate MAC address format."""
-    parts = address.split(":")
-    if len(parts) != 6:
-        return False
-    try:
-        for part in parts:
-            if len(part) != 2:
-                return False
-            int(part, 16)
-        return True
-    except ValueError:
-        return False
+    return _MAC_RE.fullmatch(address) is not None
 
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
@@ -61,37 +54,26 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     if not is_valid_mac_address(address):
         raise ValueError("Invalid Bluetooth MAC address format")
     
-    rotation = data.get(CONF_ROTATION, DEFAULT_ROTATION)
-    brightness = data.get(CONF_BRIGHTNESS, DEFAULT_BRIGHTNESS)
-
-    _LOGGER.info("Attempting to connect to BK Light at %s...", address)
-    device = BKLightDevice(address, rotation, brightness)
-
-    # Test connection with timeout
+    # Only check the device is advertising, the connection is made in setup
+    _LOGGER.info("Looking for BK Light at %s...", address)
     try:
-        connected = await asyncio.wait_for(device.connect(), timeout=30.0)
-        if not connected:
-            raise ConnectionError(
-                "Failed to connect to device. Ensure the display is powered on, "
-                "within Bluetooth range, and not paired with another device."
-            )
-        _LOGGER.info("Successfully connected to %s, disconnecting...", address)
-        await device.disconnect()
-    except asyncio.TimeoutError:
-        _LOGGER.error("Connection timeout for %s", address)
-        raise ConnectionError(
-            "Connection timeout. The device may be out of range or turned off."
-        )
-    except ValueError as err:
-        _LOGGER.error("Validation error for %s: %s", address, err)
-        raise
+        device = await BleakScanner.find_device_by_address(address, timeout=10.0)
     except Exception as err:
-        _LOGGER.error("Failed to connect to BK Light at %s - %s", address, err)
+        _LOGGER.error("Failed to scan for BK Light at %s - %s", address, err)
         raise ConnectionError(
-            f"Cannot connect to device: {err}. "
+            f"Cannot scan for device: {err}. "
             "Make sure Bluetooth is enabled and the device is in range."
         ) from err
 
+    if device is None:
+        _LOGGER.error("BK Light at %s not found", address)
+        raise ConnectionError(
+            "Device not found. Ensure the display is powered on, "
+            "within Bluetooth range, and not paired with another device."
+        )
+
+    _LOGGER.info("Found BK Light at %s", address)
+
     return {"title": data.get(CONF_NAME, DEFAULT_NAME)}
 
 
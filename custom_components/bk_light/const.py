@@ -14,17 +14,32 @@ MANUFACTURER = "BK Light"
 MODEL = "ACT1026"
 MODEL_DESCRIPTION = "32x32 RGB LED Matrix"
 
+# Advertised name prefixes of BK Light displays
+DEVICE_NAME_PREFIXES = ("LED_BLE_", "BK_LIGHT", "BJ_LED")
+
 # BLE UUIDs
 UUID_WRITE = "0000fa02-0000-1000-8000-00805f9b34fb"
 UUID_NOTIFY = "0000fa03-0000-1000-8000-00805f9b34fb"
 
+# GATT write sizing (bytes)
+DEFAULT_MTU_SIZE = 185
+ATT_HEADER_SIZE = 3
+MIN_WRITE_SIZE = 20
+
 # Update interval (seconds)
 SCAN_INTERVAL = 30
 
+# Connection keepalive (seconds)
+KEEPALIVE_INTERVAL = 20
+KEEPALIVE_MAX_BACKOFF = 300
+
 # Display dimensions
 DISPLAY_WIDTH = 32
 DISPLAY_HEIGHT = 32
 
+# Font used for text rendering
+FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
 # BLE Protocol constants
 HANDSHAKE_FIRST = bytes.fromhex("08 00 01 80 0E 06 32 00")
 HANDSHAKE_SECOND = bytes.fromhex("04 00 05 80")
@@ -1,13 +1,13 @@
 """Platform for BK Light ACT1026 image display integration."""
 from __future__ import annotations
 
-import asyncio
+import functools
 import logging
 from datetime import datetime
 from io import BytesIO
-from typing import Any
 
-from PIL import Image, ImageDraw, ImageFont
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw, ImageFont
 
 from homeassistant.components.image import ImageEntity
 from homeassistant.config_entries import ConfigEntry
@@ -19,6 +19,7 @@ from .const import (
     DISPLAY_HEIGHT,
     DISPLAY_WIDTH,
     DOMAIN,
+    FONT_PATH,
     MANUFACTURER,
     MODEL,
     MODEL_DESCRIPTION,
@@ -27,6 +28,103 @@ from .bk_light_device import BKLightDevice
 
 _LOGGER = logging.getLogger(__name__)
 
+_FONT_CACHE: dict[int, ImageFont.FreeTypeFont | ImageFont.ImageFont] = {}
+
+_CANVAS_CACHE_SIZE = 8
+_CANVAS_CACHE: dict[int | tuple[int, ...], Image.Image] = {}
+
+
+def _get_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    """Return the display font for a size, parsing it only once."""
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        try:
+            font = ImageFont.truetype(FONT_PATH, size)
+        except Exception:
+            font = ImageFont.load_default()
+        _FONT_CACHE[size] = font
+    return font
+
+
+def _blank_canvas(background: str | int | tuple[int, ...] | list[int]) -> Image.Image:
+    """Return a fresh display sized canvas copied from a cached template."""
+    # Accept the same colors as Image.new, keyed by their RGB value
+    if isinstance(background, str):
+        background = ImageColor.getrgb(background)
+    elif isinstance(background, list):
+        background = tuple(background)
+    template = _CANVAS_CACHE.get(background)
+    if template is None:
+        if len(_CANVAS_CACHE) >= _CANVAS_CACHE_SIZE:
+            _CANVAS_CACHE.clear()
+        template = Image.new("RGB", (DISPLAY_WIDTH, DISPLAY_HEIGHT), color=background)
+        _CANVAS_CACHE[background] = template
+    return template.copy()
+
+
+@functools.lru_cache(maxsize=64)
+def _text_anchor(text: str, font_size: int) -> tuple[int, int]:
+    """Return the position that centers text on the display."""
+    bbox = _get_font(font_size).getbbox(text)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+    x = (DISPLAY_WIDTH - text_width) // 2
+    y = (DISPLAY_HEIGHT - text_height) // 2
+    return x, y
+
+
+def _encode_png(image: Image.Image) -> bytes:
+    """Encode an image as PNG."""
+    buffer = BytesIO()
+    image.save(buffer, format="PNG", compress_level=1)
+    return buffer.getvalue()
+
+
+@functools.lru_cache(maxsize=4)
+def _render_clock_png(time_str: str) -> bytes:
+    """Render the clock face for a time string, cached per minute."""
+    image = _blank_canvas((0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    draw.text(_text_anchor(time_str, 12), time_str, fill=(226, 232, 255), font=_get_font(12))
+
+    return _encode_png(image)
+
+
+def _render_text(
+    text: str,
+    color: tuple[int, int, int],
+    background: tuple[int, int, int],
+    font_size: int,
+) -> Image.Image:
+    """Render centered text on a display sized image."""
+    image = _blank_canvas(background)
+    draw = ImageDraw.Draw(image)
+    draw.text(
+        _text_anchor(text, font_size), text, fill=color, font=_get_font(font_size)
+    )
+    return image
+
+
+def _prepare_image(image_bytes: bytes) -> Image.Image:
+    """Decode an image and fit it to the display."""
+    image = Image.open(BytesIO(image_bytes))
+
+    # Resize to display dimensions if needed
+    if image.size != (DISPLAY_WIDTH, DISPLAY_HEIGHT):
+        if image.format == "JPEG":
+            # Let libjpeg downscale while decoding
+            image.draft("RGB", (DISPLAY_WIDTH * 2, DISPLAY_HEIGHT * 2))
+        # LANCZOS gains nothing visible at 32x32, BILINEAR is much cheaper
+        image = image.resize(
+            (DISPLAY_WIDTH, DISPLAY_HEIGHT),
+            Image.Resampling.BILINEAR
+        )
+
+    # Convert to RGB if necessary
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    return image
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -51,7 +149,8 @@ class BKLightImageEntity(ImageEntity):
         self._device = device
         self._attr_unique_id = f"{config_entry.entry_id}_display"
         self._attr_image_url = None
-        self._current_image: Image.Image | None = None
+        self._current_png: bytes | None = None
+        self._clock: tuple[str, bytes] | None = None
         
         # Device info
         self._attr_device_info = DeviceInfo(
@@ -64,62 +163,28 @@ class BKLightImageEntity(ImageEntity):
 
     async def async_image(self) -> bytes | None:
         """Return current image as bytes."""
-        if self._current_image:
-            buffer = BytesIO()
-            self._current_image.save(buffer, format="PNG")
-            return buffer.getvalue()
-        
-        # Return a default clock display
-        return await self._generate_clock_image()
+        # Fall back to a default clock display
+        return self._current_png or await self._generate_clock_image()
 
     async def _generate_clock_image(self) -> bytes:
         """Generate a simple clock display."""
-        image = Image.new("RGB", (DISPLAY_WIDTH, DISPLAY_HEIGHT), color=(0, 0, 0))
-        draw = ImageDraw.Draw(image)
-        
-        now = datetime.now()
-        time_str = now.strftime("%H:%M")
-        
-        try:
-            # Try to use a built-in font
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 12)
-        except Exception:
-            font = ImageFont.load_default()
-        
-        # Center the text
-        bbox = draw.textbbox((0, 0), time_str, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-        x = (DISPLAY_WIDTH - text_width) // 2
-        y = (DISPLAY_HEIGHT - text_height) // 2
-        
-        draw.text((x, y), time_str, fill=(226, 232, 255), font=font)
-        
-        buffer = BytesIO()
-        image.save(buffer, format="PNG")
-        return buffer.getvalue()
+        time_str = datetime.now().strftime("%H:%M")
+        # Only hop to the executor when the minute changed
+        if self._clock is None or self._clock[0] != time_str:
+            png = await self.hass.async_add_executor_job(_render_clock_png, time_str)
+            self._clock = (time_str, png)
+        return self._clock[1]
 
     async def async_show_image(self, image_bytes: bytes) -> None:
         """Display an image on the BK Light."""
         try:
-            image = Image.open(BytesIO(image_bytes))
-            
-            # Resize to display dimensions if needed
-            if image.size != (DISPLAY_WIDTH, DISPLAY_HEIGHT):
-                image = image.resize(
-                    (DISPLAY_WIDTH, DISPLAY_HEIGHT),
-                    Image.Resampling.LANCZOS
-                )
-            
-            # Convert to RGB if necessary
-            if image.mode != "RGB":
-                image = image.convert("RGB")
-            
-            # Send to device
-            success = await self._device.send_image(image)
+            image = await self.hass.async_add_executor_job(_prepare_image, image_bytes)
+
+            # Send to device as an RGB pixel array
+            success = await self._device.send_image_array(np.asarray(image))
             
             if success:
-                self._current_image = image
+                await self._async_set_current_image(image)
                 self.async_write_ha_state()
             else:
                 _LOGGER.error("Failed to send image to device")
@@ -135,27 +200,18 @@ class BKLightImageEntity(ImageEntity):
         font_size: int = 12,
     ) -> None:
         """Display text on the BK Light."""
-        image = Image.new("RGB", (DISPLAY_WIDTH, DISPLAY_HEIGHT), color=background)
-        draw = ImageDraw.Draw(image)
-        
-        try:
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
-        except Exception:
-            font = ImageFont.load_default()
-        
-        # Center the text
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-        x = (DISPLAY_WIDTH - text_width) // 2
-        y = (DISPLAY_HEIGHT - text_height) // 2
-        
-        draw.text((x, y), text, fill=color, font=font)
-        
+        image = await self.hass.async_add_executor_job(
+            _render_text, text, color, background, font_size
+        )
+
         await self._device.send_image(image)
-        self._current_image = image
+        await self._async_set_current_image(image)
         self.async_write_ha_state()
 
+    async def _async_set_current_image(self, image: Image.Image) -> None:
+        """Store the PNG encoding of the displayed image."""
+        self._current_png = await self.hass.async_add_executor_job(_encode_png, image)
+
     @property
     def available(self) -> bool:
         """Return if the device is available."""
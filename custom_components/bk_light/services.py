@@ -2,94 +2,176 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import suppress
+import heapq
 import logging
 from typing import Final
 
 from bleak import BleakScanner
+from bleak.backends.device import BLEDevice
+from bleak.backends.scanner import AdvertisementData
 import voluptuous as vol
 
+from homeassistant.components import bluetooth
 from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.helpers import config_validation as cv
 
-from .const import DOMAIN
+from .const import DEVICE_NAME_PREFIXES, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
 SERVICE_SCAN_DEVICES: Final = "scan_devices"
 
-SERVICE_SCAN_DEVICES_SCHEMA = vol.Schema({})
+ATTR_TIMEOUT: Final = "timeout"
+DEFAULT_SCAN_TIMEOUT: Final = 15.0
+
+SERVICE_SCAN_DEVICES_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_TIMEOUT, default=DEFAULT_SCAN_TIMEOUT): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=60)
+        ),
+    }
+)
+
+# Number of strongest devices listed in the full scan dump
+MAX_LISTED_DEVICES = 25
+
+# Report separators
+_SEP60 = "-" * 60
+_EQ60 = "=" * 60
+_ITEM_SEP = "  " + "-" * 56
+
+# Lower RSSI bound (dBm, exclusive) of each signal strength label
+RSSI_BANDS: Final = ((-60, "Excellent"), (-75, "Good"), (-85, "Fair"))
+
+
+def _signal_strength(rssi: int) -> str:
+    """Return a human readable label for an RSSI value."""
+    return next((label for threshold, label in RSSI_BANDS if rssi > threshold), "Weak")
+
+
+class _DeviceScanner:
+    """BleakScanner reused across scan_devices calls."""
+
+    def __init__(self) -> None:
+        """Initialize the scanner."""
+        self._scanner: BleakScanner | None = None
+        self._lock = asyncio.Lock()
+        self._found = asyncio.Event()
+
+    def _detected(self, device: BLEDevice, advertisement_data: AdvertisementData) -> None:
+        """Flag the scan as done once a BK Light is seen."""
+        name = device.name or advertisement_data.local_name
+        if name and name.startswith(DEVICE_NAME_PREFIXES):
+            self._found.set()
+
+    async def async_discover(self, timeout: float) -> list[BLEDevice]:
+        """Scan for BLE devices, stopping early once a BK Light is seen."""
+        async with self._lock:
+            if self._scanner is None:
+                self._scanner = BleakScanner(detection_callback=self._detected)
+
+            self._found.clear()
+            await self._scanner.start()
+            try:
+                with suppress(TimeoutError):
+                    async with asyncio.timeout(timeout):
+                        await self._found.wait()
+            finally:
+                await self._scanner.stop()
+            return list(self._scanner.discovered_devices)
 
 
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for BK Light integration."""
+    scanner = _DeviceScanner()
 
     async def handle_scan_devices(call: ServiceCall) -> None:
         """Handle the scan_devices service call."""
-        _LOGGER.info("=" * 60)
-        _LOGGER.info("BK Light Device Scanner")
-        _LOGGER.info("=" * 60)
-        _LOGGER.info("Scanning for BLE devices (15 seconds)...")
+        timeout = call.data[ATTR_TIMEOUT]
+        _LOGGER.info("\n%s\nBK Light Device Scanner\n%s", _EQ60, _EQ60)
         
         try:
-            devices = await BleakScanner.discover(timeout=15.0)
-            
-            _LOGGER.info("Scan complete. Found %d BLE devices total.", len(devices))
-            _LOGGER.info("-" * 60)
+            if "bluetooth" in hass.config.components:
+                # Reuse what the running Bluetooth integration has already seen
+                _LOGGER.info("Reading BLE devices seen by Home Assistant...")
+                devices = list(
+                    bluetooth.async_discovered_service_info(hass, connectable=False)
+                )
+            else:
+                _LOGGER.info("Scanning for BLE devices (up to %.0f seconds)...", timeout)
+                devices = await scanner.async_discover(timeout)
             
             # Filter for BK Light devices
-            led_devices = [
-                d for d in devices 
-                if d.name and (
-                    d.name.startswith("LED_BLE_") or 
-                    d.name.startswith("BK_LIGHT") or 
-                    d.name.startswith("BJ_LED")
+            led_devices = []
+            for d in devices:
+                if d.name and d.name.startswith(DEVICE_NAME_PREFIXES):
+                    led_devices.append(d)
+
+            if not led_devices:
+                _LOGGER.warning(
+                    "\n✗ No BK Light devices found!\n"
+                    "Expected device names: LED_BLE_*, BK_LIGHT*, BJ_LED*\n"
+                    "\n"
+                    "Troubleshooting steps:\n"
+                    "  1. Make sure the display is powered on\n"
+                    "  2. Check the device is within 10 meters\n"
+                    "  3. Disconnect from mobile app if connected\n"
+                    "  4. Try power cycling the display"
                 )
+
+            # The report is INFO only, skip formatting it when nobody listens
+            if not _LOGGER.isEnabledFor(logging.INFO):
+                return
+
+            # Build the report and log it as a single record
+            lines: list[str] = [
+                f"Scan complete. Found {len(devices)} BLE devices total.",
+                _SEP60,
             ]
-            
+
             if led_devices:
-                _LOGGER.info("✓ Found %d BK Light device(s):", len(led_devices))
-                _LOGGER.info("-" * 60)
+                lines.append(f"✓ Found {len(led_devices)} BK Light device(s):")
+                lines.append(_SEP60)
                 for device in led_devices:
                     rssi = getattr(device, 'rssi', None)
-                    signal_strength = "Excellent" if rssi and rssi > -60 else \
-                                    "Good" if rssi and rssi > -75 else \
-                                    "Fair" if rssi and rssi > -85 else "Weak"
-                    
-                    _LOGGER.info("  Device Name:    %s", device.name)
-                    _LOGGER.info("  MAC Address:    %s", device.address)
+                    lines.append(f"  Device Name:    {device.name}")
+                    lines.append(f"  MAC Address:    {device.address}")
                     if rssi:
-                        _LOGGER.info("  Signal (RSSI):  %d dBm (%s)", rssi, signal_strength)
-                    _LOGGER.info("  " + "-" * 56)
-            else:
-                _LOGGER.warning("✗ No BK Light devices found!")
-                _LOGGER.warning("Expected device names: LED_BLE_*, BK_LIGHT*, BJ_LED*")
-                _LOGGER.warning("")
-                _LOGGER.warning("Troubleshooting steps:")
-                _LOGGER.warning("  1. Make sure the display is powered on")
-                _LOGGER.warning("  2. Check the device is within 10 meters")
-                _LOGGER.warning("  3. Disconnect from mobile app if connected")
-                _LOGGER.warning("  4. Try power cycling the display")
+                        lines.append(f"  Signal (RSSI):  {rssi} dBm ({_signal_strength(rssi)})")
+                    lines.append(_ITEM_SEP)
                 
             # Show all devices for debugging
-            _LOGGER.info("")
-            _LOGGER.info("All BLE devices found:")
-            _LOGGER.info("-" * 60)
-            for device in sorted(devices, key=lambda d: getattr(d, 'rssi', -100), reverse=True):
+            lines.append("")
+            lines.append(
+                f"Strongest BLE devices found "
+                f"({min(len(devices), MAX_LISTED_DEVICES)} of {len(devices)}):"
+            )
+            lines.append(_SEP60)
+            strongest = heapq.nlargest(
+                MAX_LISTED_DEVICES,
+                devices,
+                key=lambda d: getattr(d, 'rssi', None) or -100,
+            )
+            for device in strongest:
                 name = device.name or "<Unnamed>"
                 rssi = getattr(device, 'rssi', None)
                 rssi_str = f"{rssi} dBm" if rssi else "N/A"
-                _LOGGER.info("  %-30s %s  (RSSI: %s)", name[:30], device.address, rssi_str)
+                lines.append(f"  {name[:30]:<30} {device.address}  (RSSI: {rssi_str})")
             
-            _LOGGER.info("=" * 60)
-            _LOGGER.info("Scan complete. Check the information above.")
-            _LOGGER.info("=" * 60)
+            lines.append(_EQ60)
+            lines.append("Scan complete. Check the information above.")
+            lines.append(_EQ60)
+            _LOGGER.info("\n%s", "\n".join(lines))
                 
         except Exception as err:
-            _LOGGER.error("=" * 60)
-            _LOGGER.error("Error scanning for devices: %s", err)
-            _LOGGER.error("This may indicate a Bluetooth adapter issue.")
-            _LOGGER.error("Try: sudo hciconfig hci0 up")
-            _LOGGER.error("=" * 60)
+            _LOGGER.error(
+                "\n%s\nError scanning for devices: %s\n"
+                "This may indicate a Bluetooth adapter issue.\n"
+                "Try: sudo hciconfig hci0 up\n%s",
+                _EQ60,
+                err,
+                _EQ60,
+            )
 
     hass.services.async_register(
         DOMAIN,
@@ -9,62 +9,102 @@ Usage:
 """
 
 import asyncio
+import heapq
 import sys
 from bleak import BleakScanner, BleakClient
 
 UUID_WRITE = "0000fa02-0000-1000-8000-00805f9b34fb"
 UUID_NOTIFY = "0000fa03-0000-1000-8000-00805f9b34fb"
 
+# Advertised name prefixes of BK Light displays
+LED_PREFIXES = ("LED_BLE", "BK_LIGHT", "BJ_LED")
+
+# Number of strongest devices listed in the full scan dump
+MAX_LISTED_DEVICES = 25
+
+# Report separators
+SEP70 = "-" * 70
+EQ70 = "=" * 70
+ITEM_SEP = "  " + "-" * 66
+
+# Lower RSSI bound (dBm, exclusive) of each signal strength label
+RSSI_BANDS = ((-60, "Excellent"), (-75, "Good"), (-85, "Fair"))
+
+
+def signal_strength(rssi):
+    """Return a human readable label for an RSSI value."""
+    return next((label for threshold, label in RSSI_BANDS if rssi > threshold), "Weak")
+
+
+async def discover(timeout=15.0):
+    """Scan for BLE devices, stopping early once a BK Light is seen."""
+    found = asyncio.Event()
+
+    def detected(device, advertisement_data):
+        name = device.name or advertisement_data.local_name
+        if name and name.startswith(LED_PREFIXES):
+            found.set()
+
+    scanner = BleakScanner(detection_callback=detected)
+    await scanner.start()
+    try:
+        await asyncio.wait_for(found.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        await scanner.stop()
+    return list(scanner.discovered_devices)
+
 
 async def scan_devices():
     """Scan for all BLE devices."""
-    print("=" * 70)
+    print(EQ70)
     print("BK Light ACT1026 Diagnostic Tool")
-    print("=" * 70)
-    print("\nScanning for BLE devices (15 seconds)...\n")
+    print(EQ70)
+    print("\nScanning for BLE devices (up to 15 seconds)...\n")
     
     try:
-        devices = await BleakScanner.discover(timeout=15.0)
+        devices = await discover(timeout=15.0)
         
-        print(f"Found {len(devices)} BLE devices total\n")
-        print("-" * 70)
+        # Build the report and write it in one go
+        lines = [f"Found {len(devices)} BLE devices total\n", SEP70]
         
         # Look for BK Light devices
-        led_devices = [
-            d for d in devices 
-            if d.name and any(prefix in d.name for prefix in ["LED_BLE", "BK_LIGHT", "BJ_LED"])
-        ]
+        led_devices = []
+        for d in devices:
+            if d.name and d.name.startswith(LED_PREFIXES):
+                led_devices.append(d)
         
         if led_devices:
-            print(f"✓ Found {len(led_devices)} BK Light device(s):\n")
+            lines.append(f"✓ Found {len(led_devices)} BK Light device(s):\n")
             for device in led_devices:
                 rssi = getattr(device, 'rssi', None)
-                signal = "Excellent" if rssi and rssi > -60 else \
-                        "Good" if rssi and rssi > -75 else \
-                        "Fair" if rssi and rssi > -85 else "Weak"
-                
-                print(f"  Device Name:    {device.name}")
-                print(f"  MAC Address:    {device.address}")
+                lines.append(f"  Device Name:    {device.name}")
+                lines.append(f"  MAC Address:    {device.address}")
                 if rssi:
-                    print(f"  Signal (RSSI):  {rssi} dBm ({signal})")
-                print(f"  {'-' * 66}")
+                    lines.append(f"  Signal (RSSI):  {rssi} dBm ({signal_strength(rssi)})")
+                lines.append(ITEM_SEP)
         else:
-            print("✗ No BK Light devices found!\n")
-            print("Troubleshooting:")
-            print("  • Make sure the display is powered on")
-            print("  • Device should be within 10 meters")
-            print("  • Disconnect from mobile app if connected")
-            print("  • Try power cycling the display\n")
+            lines.append("✗ No BK Light devices found!\n")
+            lines.append("Troubleshooting:")
+            lines.append("  • Make sure the display is powered on")
+            lines.append("  • Device should be within 10 meters")
+            lines.append("  • Disconnect from mobile app if connected")
+            lines.append("  • Try power cycling the display\n")
         
         # Show all devices
-        print("\nAll BLE devices discovered:")
-        print("-" * 70)
-        for device in sorted(devices, key=lambda d: getattr(d, 'rssi', -100), reverse=True):
+        lines.append(f"\nStrongest BLE devices discovered ({min(len(devices), MAX_LISTED_DEVICES)} of {len(devices)}):")
+        lines.append(SEP70)
+        strongest = heapq.nlargest(
+            MAX_LISTED_DEVICES, devices, key=lambda d: getattr(d, 'rssi', None) or -100
+        )
+        for device in strongest:
             name = device.name or "<Unnamed>"
             rssi = getattr(device, 'rssi', None)
             rssi_str = f"{rssi:4d} dBm" if rssi else "  N/A"
-            print(f"  {name[:40]:<40} {device.address}  {rssi_str}")
+            lines.append(f"  {name[:40]:<40} {device.address}  {rssi_str}")
         
+        sys.stdout.write("\n".join(lines) + "\n")
         return led_devices
         
     except Exception as err:
@@ -81,9 +121,9 @@ async def scan_devices():
 
 async def test_connection(address: str):
     """Test connection to a specific device."""
-    print("\n" + "=" * 70)
+    print("\n" + EQ70)
     print(f"Testing connection to {address}...")
-    print("=" * 70 + "\n")
+    print(EQ70 + "\n")
     
     try:
         print("Step 1: Scanning for device...")
@@ -148,16 +188,16 @@ async def main():
         led_devices = await scan_devices()
         
         if led_devices:
-            print("\n" + "=" * 70)
+            print("\n" + EQ70)
             print("Next steps:")
-            print("=" * 70)
+            print(EQ70)
             print("\nTo test connection to a specific device, run:")
             for device in led_devices:
                 print(f"  python3 diagnostic.py {device.address}")
         
-    print("\n" + "=" * 70)
+    print("\n" + EQ70)
     print("Diagnostic complete")
-    print("=" * 70)
+    print(EQ70)
 
 
 if __name__ == "__main__":